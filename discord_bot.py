@@ -10,9 +10,10 @@ Required environment variables:
 """
 
 import os
+import asyncio
+import aiohttp
 import discord
 from discord import app_commands
-import requests
 
 # ─────────────────────────────────────────────
 # CONFIG
@@ -23,11 +24,15 @@ GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "") #
 GITHUB_REPO = os.environ.get("GITHUB_REPO", "")  # e.g. "neilhutcheon/fantasy-dg-auto-scoring" 
 WORKFLOW_FILENAME = "fantasy_disc_golf_github_action.yml"
 
+# Reused across /score invocations so the GitHub API connection stays warm.
+# Created in main() before the bot connects (needs the running event loop) and closed on shutdown.
+_HTTP = None
+
 # ─────────────────────────────────────────────
 # GITHUB API
 # ─────────────────────────────────────────────
 
-def trigger_github_workflow(tourn_id: int, event_name: str, final: bool = False) -> dict:
+async def trigger_github_workflow(tourn_id: int, event_name: str, final: bool = False) -> dict:
     """
     Trigger the GitHub Actions workflow via workflow_dispatch.
     Returns a dict with 'success' (bool) and 'message' (str).
@@ -49,11 +54,11 @@ def trigger_github_workflow(tourn_id: int, event_name: str, final: bool = False)
         },
     }
 
-    resp = requests.post(url, json=payload, headers=headers, timeout=15)
-    if resp.status_code == 204:
-        return {"success": True, "message": "Workflow triggered successfully."}
-    else:
-        return {"success": False, "message": f"GitHub API error {resp.status_code}: {resp.text}"}
+    async with _HTTP.post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+        if resp.status == 204:
+            return {"success": True, "message": "Workflow triggered successfully."}
+        else:
+            return {"success": False, "message": f"GitHub API error {resp.status}: {await resp.text()}"}
 
 # ─────────────────────────────────────────────
 # DISCORD BOT
@@ -79,7 +84,7 @@ async def score_command(
     mode = "🏁 Final" if final else "🔴 Live"
     await interaction.response.defer(thinking=True)
 
-    result = trigger_github_workflow(tourn_id, event_name, final)
+    result = await trigger_github_workflow(tourn_id, event_name, final)
 
     if result["success"]:
         embed = discord.Embed(
@@ -149,6 +154,16 @@ async def on_ready():
 # ENTRY POINT
 # ─────────────────────────────────────────────
 
+async def main():
+    global _HTTP
+    _HTTP = aiohttp.ClientSession()
+    try:
+        async with client:
+            await client.start(DISCORD_BOT_TOKEN)
+    finally:
+        await _HTTP.close()
+
+
 if __name__ == "__main__":
     if not DISCORD_BOT_TOKEN:
         print("❌ DISCORD_BOT_TOKEN environment variable not set.")
@@ -166,4 +181,5 @@ if __name__ == "__main__":
         print("⚠️  GITHUB_REPO not set — /score command will fail.")
         print("   Set it to your repo, e.g.: export GITHUB_REPO='youruser/fantasy-dg-auto-scoring'")
 
-    client.run(DISCORD_BOT_TOKEN)
+    discord.utils.setup_logging()
+    asyncio.run(main())
@@ -10,6 +10,8 @@ Usage:
 
 Setup:
   pip install requests gspread google-auth
+  pip install orjson           # optional: faster parsing of PDGA responses
+  pip install requests-cache   # optional: caches PDGA responses between local runs (--no-cache to bypass)
 
 Discord: Set DISCORD_WEBHOOK env var, or paste URL directly in CONFIG below.
 Google Sheets: Set GOOGLE_SHEETS_ID env var, or paste ID directly in CONFIG below.
@@ -17,12 +19,28 @@ Google Sheets: Set GOOGLE_SHEETS_ID env var, or paste ID directly in CONFIG belo
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import sys
 import argparse
+import functools
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # ─────────────────────────────────────────────
 # CONFIG — edit these
 # ─────────────────────────────────────────────
@@ -72,6 +90,7 @@ TEAMS = {
 
 # Tournament schedule with PDGA IDs (fill in as the season progresses)
 # Find IDs at: https://api.pdga.com/services/json/event?tier=ES,NT&start_date=2026-01-01&end_date=2026-12-31
+# Keep this in the same order as the event rows on the SEASON SCORE tab — EVENT_ROW is derived from it.
 SCHEDULE = {
     "Supreme Flight Open":          {"id": 101154, "type": "individual", "dates": "Feb 27-Mar 1"},
     "Big Easy":                     {"id": None,   "type": "individual", "dates": "Mar 13-15"},
@@ -97,12 +116,15 @@ SCHEDULE = {
     "USDGC":                        {"id": None,   "type": "full",       "dates": "Oct 8-11",  "special": "double"},
 }
 
+# Row of each event on the SEASON SCORE tab (row 1 is the header), in SCHEDULE order
+EVENT_ROW = {name: i + 2 for i, name in enumerate(SCHEDULE)}
+
 # ─────────────────────────────────────────────
 # SCORING RULES
 # ─────────────────────────────────────────────
 
-def individual_placement_points(place, division="MPO"):
-    """Points awarded for finishing position in either division."""
+def _placement_points(place, division):
+    """Placement rules behind the _PLACEMENT_POINTS lookup table."""
     if place == 1:
         return 7
     elif place <= 3:
@@ -115,6 +137,17 @@ def individual_placement_points(place, division="MPO"):
         return 1
     return 0
 
+# Points by finishing place for each division, precomputed once
+_PLACEMENT_POINTS = {
+    div: tuple(_placement_points(place, div) for place in range(200))
+    for div in ("MPO", "FPO")
+}
+
+def individual_placement_points(place, division="MPO"):
+    """Points awarded for finishing position in either division."""
+    table = _PLACEMENT_POINTS[division]
+    return table[place] if 0 <= place < len(table) else 0
+
 MINI_GAME_POINTS = {1: 10, 2: 7, 3: 5, 4: 3}
 WEAK_ROSTER_PENALTY = 3  # extra strokes over worst opponent's top-3
 
@@ -125,34 +158,101 @@ WEAK_ROSTER_PENALTY = 3  # extra strokes over worst opponent's top-3
 PDGA_LIVE_API = "https://www.pdga.com/apps/tournament/live-api/live_results_fetch_round"
 PDGA_EVENT_API = "https://api.pdga.com/services/json/event"
 
-def fetch_round_scores(tourn_id, division, round_num):
-    """Fetch scores for a specific round from PDGA live API."""
-    resp = requests.get(PDGA_LIVE_API, params={
+# Local response cache (needs requests-cache). It lives in a sqlite file in the working
+# directory, so it only helps repeat runs on the same machine — GitHub Actions runners
+# start fresh every time and don't keep it.
+LIVE_CACHE_TTL = 60  # seconds a live round response is reused across repeat runs
+CACHE_NAME = ".pdga_cache"
+
+def make_session(use_cache=False):
+    """
+    Build the shared HTTP session so repeated PDGA/Discord calls reuse keep-alive
+    connections instead of paying a fresh TCP+TLS handshake each time.
+    With use_cache and requests-cache installed, GET responses are cached for LIVE_CACHE_TTL seconds.
+    """
+    if use_cache and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name=CACHE_NAME, backend="sqlite", expire_after=LIVE_CACHE_TTL,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,  # hand the last response back so callers can check its status
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": "fantasy-dg-auto-scoring/1.0",
+        "Accept": "application/json",
+    })
+    return session
+
+# Plain session by default; the CLI swaps in a cached one unless --no-cache is passed
+_SESSION = make_session()
+
+def _get_round(tourn_id, division, round_num):
+    """GET a single round from the PDGA live API and return the raw response."""
+    resp = _SESSION.get(PDGA_LIVE_API, params={
         "TournID": tourn_id,
         "Division": division,
         "Round": round_num,
     }, timeout=15)
     resp.raise_for_status()
-    data = resp.json()
+    return resp
+
+def _pin_cached_response(resp):
+    """Keep a finished round's response in the cache with no expiry — it won't change."""
+    if requests_cache is None or not isinstance(_SESSION, requests_cache.CachedSession):
+        return
+    if not getattr(resp, "from_cache", False):
+        _SESSION.cache.save_response(resp, expires=None)
+
+def fetch_round_scores(tourn_id, division, round_num):
+    """Fetch scores for a specific round from PDGA live API."""
+    data = json_loads(_get_round(tourn_id, division, round_num).content)
     return data["data"]["scores"]
 
+def _completed_round(fetch):
+    """Run a round fetch; return (resp, scores) if any player has completed it, else None."""
+    try:
+        resp = fetch()
+        scores = json_loads(resp.content)["data"]["scores"]
+    except Exception:
+        return None
+    if scores and any(s.get("Completed") for s in scores):
+        return resp, scores
+    return None
+
 def fetch_final_scores(tourn_id, division):
     """Fetch final tournament results (use round 99 which gives cumulative)."""
-    # Try progressively higher round numbers to find the final
-    for round_num in [4, 3, 2, 1]:
-        try:
-            scores = fetch_round_scores(tourn_id, division, round_num)
-            if scores and any(s.get("Completed") for s in scores):
-                return scores
-        except Exception:
-            continue
-    return []
+    # Fetch every candidate round at once (3-day events never have a round 4),
+    # then take the highest round with a completed player.
+    round_nums = [4, 3, 2, 1]
+    found = None
+    with ThreadPoolExecutor(max_workers=len(round_nums)) as executor:
+        futures = [executor.submit(_get_round, tourn_id, division, round_num) for round_num in round_nums]
+        for future in futures:
+            found = _completed_round(future.result)
+            if found:
+                break
+    if not found:
+        return []
+    resp, scores = found
+    # Only pin once every player is done; a partly finished round must still refresh
+    if all(s.get("Completed") for s in scores):
+        _pin_cached_response(resp)
+    return scores
 
 def lookup_tournament_id(name, year=2026):
     """Look up a PDGA tournament ID by name."""
     start = f"{year}-01-01"
     end = f"{year}-12-31"
-    resp = requests.get(PDGA_EVENT_API, params={
+    resp = _SESSION.get(PDGA_EVENT_API, params={
         "tier": "ES,NT,M",
         "start_date": start,
         "end_date": end,
@@ -161,7 +261,7 @@ def lookup_tournament_id(name, year=2026):
     if resp.status_code != 200:
         print(f"Warning: Could not reach PDGA events API (status {resp.status_code})")
         return None
-    events = resp.json()
+    events = json_loads(resp.content)
     name_lower = name.lower()
     for event in events:
         if name_lower in event.get("name", "").lower():
@@ -174,60 +274,65 @@ def lookup_tournament_id(name, year=2026):
 # SCORE CALCULATION
 # ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name):
     """Lowercase + strip for fuzzy matching."""
     return name.lower().strip()
 
-def find_player_result(scores, player_name):
-    """Find a player's result in the scores list by name (fuzzy)."""
-    target = normalize_name(player_name)
+def build_name_index(scores):
+    """
+    Index a scores list by normalized name for O(1) roster lookups.
+    Returns (by_full, by_fl): keyed on the "Name" field and on "first last".
+    """
+    by_full = {}
+    by_fl = {}
     for s in scores:
-        if normalize_name(s["Name"]) == target:
-            return s
-        # Try last name match as fallback
-        last = normalize_name(s["LastName"])
-        first = normalize_name(s["FirstName"])
-        if target in f"{first} {last}" or f"{first} {last}" in target:
+        by_full.setdefault(normalize_name(s["Name"]), s)
+        by_fl.setdefault(f"{normalize_name(s['FirstName'])} {normalize_name(s['LastName'])}", s)
+    return by_full, by_fl
+
+def find_player_result(name_index, target):
+    """Find a player's result by normalized name (exact match first, then fuzzy)."""
+    by_full, by_fl = name_index
+    result = by_full.get(target) or by_fl.get(target)
+    if result:
+        return result
+    # Fall back to a substring match either way round
+    for full, s in by_fl.items():
+        if target in full or full in target:
             return s
     return None
 
+# Roster flattened once at import: (team, division, player, normalized name)
+_ROSTER = [
+    (team, div, player, normalize_name(player))
+    for team, roster in TEAMS.items()
+    for div, players in roster.items()
+    for player in players
+]
+
 def calculate_individual_points(scores_mpo, scores_fpo, event_name=""):
     """
     Calculate individual placement fantasy points for all teams.
     Returns dict: {team_name: {player_name: {place, score, points}}}
     """
-    results = {}
-
-    for team_name, roster in TEAMS.items():
-        results[team_name] = {"MPO": {}, "FPO": {}, "total_placement_points": 0}
-
-        for player in roster["MPO"]:
-            result = find_player_result(scores_mpo, player)
-            if result:
-                place = result["RunningPlace"]
-                pts = individual_placement_points(place, "MPO")
-                results[team_name]["MPO"][player] = {
-                    "place": place,
-                    "score": result["ToPar"],
-                    "total": result["GrandTotal"],
-                    "points": pts,
-                    "completed": bool(result.get("Completed")),
-                }
-                results[team_name]["total_placement_points"] += pts
-
-        for player in roster["FPO"]:
-            result = find_player_result(scores_fpo, player)
-            if result:
-                place = result["RunningPlace"]
-                pts = individual_placement_points(place, "FPO")
-                results[team_name]["FPO"][player] = {
-                    "place": place,
-                    "score": result["ToPar"],
-                    "total": result["GrandTotal"],
-                    "points": pts,
-                    "completed": bool(result.get("Completed")),
-                }
-                results[team_name]["total_placement_points"] += pts
+    results = {team_name: {"MPO": {}, "FPO": {}, "total_placement_points": 0} for team_name in TEAMS}
+    indexes = {"MPO": build_name_index(scores_mpo), "FPO": build_name_index(scores_fpo)}
+
+    for team_name, div, player, target in _ROSTER:
+        result = find_player_result(indexes[div], target)
+        if result:
+            place = result["RunningPlace"]
+            pts = individual_placement_points(place, div)
+            team_result = results[team_name]
+            team_result[div][player] = {
+                "place": place,
+                "score": result["ToPar"],
+                "total": result["GrandTotal"],
+                "points": pts,
+                "completed": bool(result.get("Completed")),
+            }
+            team_result["total_placement_points"] += pts
 
     return results
 
@@ -236,8 +341,7 @@ def get_team_score(team_result, division, top_n=3):
     players = team_result[division]
     if not players:
         return None
-    sorted_players = sorted(players.items(), key=lambda x: x[1]["total"])
-    top = sorted_players[:top_n]
+    top = heapq.nsmallest(top_n, players.items(), key=lambda x: x[1]["total"])
     return sum(p[1]["total"] for p in top), [p[0] for p in top]
 
 def calculate_mini_game_points(individual_results, is_double=False):
@@ -246,25 +350,27 @@ def calculate_mini_game_points(individual_results, is_double=False):
     Returns sorted team standings with mini-game points.
     """
     team_totals = {}
+    if not individual_results:
+        return team_totals
 
-    # Gather all top-3 scores for weak roster penalty calculation
-    all_mpo_top3 = []
-    all_fpo_top3 = []
-    for team_name, result in individual_results.items():
-        mpo = get_team_score(result, "MPO")
-        fpo = get_team_score(result, "FPO")
-        if mpo:
-            all_mpo_top3.append(mpo[0])
-        if fpo:
-            all_fpo_top3.append(fpo[0])
-
-    worst_mpo = max(all_mpo_top3) if all_mpo_top3 else None
-    worst_fpo = max(all_fpo_top3) if all_fpo_top3 else None
-
+    team_scores = {}
+    any_short = False
     for team_name, result in individual_results.items():
         mpo = get_team_score(result, "MPO")
         fpo = get_team_score(result, "FPO")
-
+        team_scores[team_name] = (mpo, fpo)
+        if not mpo or not fpo:
+            any_short = True
+
+    # Worst top-3 scores are only needed for the weak roster penalty
+    worst_mpo = worst_fpo = None
+    if any_short:
+        all_mpo_top3 = [mpo[0] for mpo, _ in team_scores.values() if mpo]
+        all_fpo_top3 = [fpo[0] for _, fpo in team_scores.values() if fpo]
+        worst_mpo = max(all_mpo_top3) if all_mpo_top3 else None
+        worst_fpo = max(all_fpo_top3) if all_fpo_top3 else None
+
+    for team_name, (mpo, fpo) in team_scores.items():
         # Apply weak roster penalty if fewer than 3 players
         mpo_score = mpo[0] if mpo else (worst_mpo + WEAK_ROSTER_PENALTY if worst_mpo else 999)
         fpo_score = fpo[0] if fpo else (worst_fpo + WEAK_ROSTER_PENALTY if worst_fpo else 999)
@@ -297,27 +403,39 @@ def calculate_mini_game_points(individual_results, is_double=False):
 # OUTPUT FORMATTING
 # ─────────────────────────────────────────────
 
+PLACE_EMOJIS = ("🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣")
+
 def format_score(to_par):
     if to_par == 0:
         return "E"
     return f"+{to_par}" if to_par > 0 else str(to_par)
 
-def build_discord_message(event_name, event_type, individual_results, mini_game=None, is_live=True):
+def sort_individual_results(individual_results):
+    """
+    Sort teams by placement points (highest first) and each team's players by place.
+    Player lists are stashed on each result as "_sorted_MPO"/"_sorted_FPO" so every
+    formatter can share one sorted view. Returns the sorted list of (team_name, result).
+    """
+    for result in individual_results.values():
+        for div in ["MPO", "FPO"]:
+            result[f"_sorted_{div}"] = sorted(result[div].items(), key=lambda x: x[1]["place"])
+    return sorted(individual_results.items(), key=lambda x: -x[1]["total_placement_points"])
+
+def build_discord_message(event_name, event_type, individual_results, mini_game=None, is_live=True, sorted_teams=None):
     """Build a Discord message summarizing fantasy scores for an event."""
+    if sorted_teams is None:
+        sorted_teams = sort_individual_results(individual_results)
+    updated = datetime.now().strftime('%b %d %I:%M %p')
     status = "🔴 LIVE" if is_live else "✅ FINAL"
     lines = [f"## 🥏 Fantasy Disc Golf — {event_name} ({status})\n"]
 
     # Individual placement points summary
     lines.append("### 📊 Individual Placement Points")
-    sorted_teams = sorted(
-        individual_results.items(),
-        key=lambda x: -x[1]["total_placement_points"]
-    )
     for team_name, result in sorted_teams:
         pts = result["total_placement_points"]
         notables = []
         for div in ["MPO", "FPO"]:
-            for player, pdata in result[div].items():
+            for player, pdata in result[f"_sorted_{div}"]:
                 if pdata["points"] > 0:
                     notables.append(f"{player} (#{pdata['place']}, {format_score(pdata['score'])}, +{pdata['points']}pts)")
         notable_str = ", ".join(notables) if notables else "no points yet"
@@ -328,7 +446,8 @@ def build_discord_message(event_name, event_type, individual_results, mini_game=
         lines.append("\n### 🏆 Team Mini-Game (Top 3 MPO + Top 3 FPO)")
         mg_sorted = sorted(mini_game.items(), key=lambda x: x[1]["mini_game_place"])
         for team_name, mg in mg_sorted:
-            place_emoji = ["🥇","🥈","🥉","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣"][mg["mini_game_place"]-1]
+            place = mg["mini_game_place"]
+            place_emoji = PLACE_EMOJIS[place-1] if place <= len(PLACE_EMOJIS) else f"#{place}"
             mpo_str = ", ".join(mg["mpo_players"])
             fpo_str = ", ".join(mg["fpo_players"])
             lines.append(
@@ -337,7 +456,7 @@ def build_discord_message(event_name, event_type, individual_results, mini_game=
                 f"→ **{mg['mini_game_points']} pts**"
             )
 
-    lines.append(f"\n_Updated: {datetime.now().strftime('%b %d %I:%M %p')}_")
+    lines.append(f"\n_Updated: {updated}_")
     return "\n".join(lines)
 
 def post_to_discord(message):
@@ -346,38 +465,52 @@ def post_to_discord(message):
         print("[Discord] Webhook not configured, printing message instead:\n")
         print(message)
         return
-    resp = requests.post(DISCORD_WEBHOOK, json={"content": message}, timeout=10)
+    resp = _SESSION.post(DISCORD_WEBHOOK, json={"content": message}, timeout=10)
     if resp.status_code in (200, 204):
         print("✅ Posted to Discord")
     else:
         print(f"❌ Discord error: {resp.status_code} {resp.text}")
 
+# Authorized gspread client and opened spreadsheet, created on first use and reused after
+_GS_CLIENT = None
+_GS_SHEET = None
+
 def update_google_sheets(event_name, individual_results, mini_game=None):
     """Update the SEASON SCORE tab in Google Sheets."""
-    try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-    except ImportError:
-        print("⚠️  gspread not installed. Run: pip install gspread google-auth")
-        return
-
-    if not os.path.exists(GOOGLE_CREDS_FILE):
-        print(f"⚠️  Google credentials not found at '{GOOGLE_CREDS_FILE}'. Skipping Sheets update.")
-        return
-
-    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-    creds = Credentials.from_service_account_file(GOOGLE_CREDS_FILE, scopes=scopes)
-    gc = gspread.authorize(creds)
-    sh = gc.open_by_key(GOOGLE_SHEETS_ID)
-    ws = sh.worksheet("SEASON SCORE")
+    global _GS_CLIENT, _GS_SHEET
 
-    # Find the event row
-    col_a = ws.col_values(1)
-    try:
-        event_row = next(i+1 for i, v in enumerate(col_a) if event_name.lower() in v.lower())
-    except StopIteration:
-        print(f"⚠️  Could not find '{event_name}' in SEASON SCORE sheet. Skipping update.")
-        return
+    if _GS_SHEET is None:
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+        except ImportError:
+            print("⚠️  gspread not installed. Run: pip install gspread google-auth")
+            return
+
+        if not os.path.exists(GOOGLE_CREDS_FILE):
+            print(f"⚠️  Google credentials not found at '{GOOGLE_CREDS_FILE}'. Skipping Sheets update.")
+            return
+
+        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+        creds = Credentials.from_service_account_file(GOOGLE_CREDS_FILE, scopes=scopes)
+        _GS_CLIENT = gspread.authorize(creds)
+        _GS_SHEET = _GS_CLIENT.open_by_key(GOOGLE_SHEETS_ID)
+    sh = _GS_SHEET
+
+    # Find the event row — check the expected row's label first (one cell), otherwise search column A
+    event_row = EVENT_ROW.get(event_name)
+    if event_row is not None:
+        rows = sh.values_get(f"'SEASON SCORE'!A{event_row}").get("values", [])
+        label = rows[0][0] if rows and rows[0] else ""
+        if event_name.lower() not in label.lower():
+            event_row = None
+    if event_row is None:
+        col_a = [row[0] if row else "" for row in sh.values_get("'SEASON SCORE'!A:A").get("values", [])]
+        try:
+            event_row = next(i+1 for i, v in enumerate(col_a) if event_name.lower() in v.lower())
+        except StopIteration:
+            print(f"⚠️  Could not find '{event_name}' in SEASON SCORE sheet. Skipping update.")
+            return
 
     # Column order matches sheet: Scoober Steves, Rob's, Brian's, Donny's, Sage, Rem's, Caldwell's, Neil's
     team_order = [
@@ -392,21 +525,26 @@ def update_google_sheets(event_name, individual_results, mini_game=None):
             pts += mini_game[team]["mini_game_points"]
         row_values.append(pts)
 
-    # Update columns B through I (indices 2-9)
-    ws.update(f"B{event_row}:I{event_row}", [row_values])
+    # Update columns B through I (indices 2-9) in a single request
+    sh.values_batch_update({
+        "valueInputOption": "RAW",
+        "data": [{"range": f"'SEASON SCORE'!B{event_row}:I{event_row}", "values": [row_values]}],
+    })
     print(f"✅ Updated Google Sheets row {event_row} ({event_name})")
 
-def print_summary(event_name, event_type, individual_results, mini_game=None):
+def print_summary(event_name, event_type, individual_results, mini_game=None, sorted_teams=None):
     """Print a readable summary to the terminal."""
+    if sorted_teams is None:
+        sorted_teams = sort_individual_results(individual_results)
     print(f"\n{'='*60}")
     print(f"  {event_name.upper()} — FANTASY RESULTS")
     print(f"{'='*60}")
 
     print("\n📍 Individual Placement Points:")
-    for team_name, result in sorted(individual_results.items(), key=lambda x: -x[1]["total_placement_points"]):
+    for team_name, result in sorted_teams:
         print(f"  {team_name}: {result['total_placement_points']} pts")
         for div in ["MPO", "FPO"]:
-            for player, pdata in sorted(result[div].items(), key=lambda x: x[1]["place"]):
+            for player, pdata in result[f"_sorted_{div}"]:
                 flag = "✓" if pdata["completed"] else "~"
                 print(f"    {flag} [{div}] {player}: #{pdata['place']} ({format_score(pdata['score'])}) → {pdata['points']} pts")
 
@@ -425,13 +563,19 @@ def run(tourn_id, event_name, event_type, round_num=None, is_final=False, double
 
     if is_final or round_num is None:
         print("  Mode: Final results")
-        scores_mpo = fetch_final_scores(tourn_id, "MPO")
-        scores_fpo = fetch_final_scores(tourn_id, "FPO")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mpo_future = executor.submit(fetch_final_scores, tourn_id, "MPO")
+            fpo_future = executor.submit(fetch_final_scores, tourn_id, "FPO")
+            scores_mpo = mpo_future.result()
+            scores_fpo = fpo_future.result()
         is_live = False
     else:
         print(f"  Mode: Round {round_num} (live)")
-        scores_mpo = fetch_round_scores(tourn_id, "MPO", round_num)
-        scores_fpo = fetch_round_scores(tourn_id, "FPO", round_num)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            mpo_future = executor.submit(fetch_round_scores, tourn_id, "MPO", round_num)
+            fpo_future = executor.submit(fetch_round_scores, tourn_id, "FPO", round_num)
+            scores_mpo = mpo_future.result()
+            scores_fpo = fpo_future.result()
         is_live = True
 
     if not scores_mpo and not scores_fpo:
@@ -446,10 +590,12 @@ def run(tourn_id, event_name, event_type, round_num=None, is_final=False, double
     if event_type == "full":
         mini_game = calculate_mini_game_points(individual_results, is_double=double_points)
 
-    print_summary(event_name, event_type, individual_results, mini_game)
+    sorted_teams = sort_individual_results(individual_results)
+
+    print_summary(event_name, event_type, individual_results, mini_game, sorted_teams)
 
     if post_discord:
-        msg = build_discord_message(event_name, event_type, individual_results, mini_game, is_live)
+        msg = build_discord_message(event_name, event_type, individual_results, mini_game, is_live, sorted_teams)
         post_to_discord(msg)
 
     if update_sheets and is_final:
@@ -465,8 +611,12 @@ if __name__ == "__main__":
     parser.add_argument("--lookup-id", type=str, help="Look up tournament ID by name")
     parser.add_argument("--no-discord", action="store_true", help="Skip Discord post")
     parser.add_argument("--no-sheets", action="store_true", help="Skip Google Sheets update")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local PDGA response cache")
     args = parser.parse_args()
 
+    if not args.no_cache:
+        _SESSION = make_session(use_cache=True)
+
     if args.lookup_id:
         lookup_tournament_id(args.lookup_id)
         sys.exit(0)